@@ -22,7 +22,120 @@ import signal
 import atexit
 import weakref
 import requests
+from requests.adapters import HTTPAdapter
 import urllib.parse
+import base64
+import contextlib
+import io
+import types
+from collections import deque
+from statistics import median_low
+import logging
+import hashlib
+import gzip
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+import numpy as np
+
+try:
+    import blake3  # SIMD, multi-threaded hashing for cache keys
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson  # Faster settings (de)serialization
+except ImportError:
+    orjson = None
+
+
+log = logging.getLogger("mlxwhisper")
+log.setLevel(logging.DEBUG if os.environ.get("MLXWHISPER_DEBUG") == "1" else logging.INFO)
+
+_PLATFORM = platform.system()  # Fixed for the process lifetime
+_IS_WINDOWS = _PLATFORM == "Windows"
+
+# Per-user paths, expanded once at import
+_SETTINGS_FILE = os.path.expanduser("~/.mlx_whisper_circuit_settings.json")
+_LOCK_DIR = os.path.expanduser("~/Library/Application Support/MLXWhisperGUI")  # macOS lock/PID files
+
+# Process isolation options for ffprobe/ffmpeg helper subprocesses
+if _IS_WINDOWS:
+    _SUBPROCESS_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP, "start_new_session": False}
+else:
+    _SUBPROCESS_KWARGS = {"start_new_session": True}
+
+# Default template for the "Meeting Minutes Template" box in the Settings tab
+DEFAULT_MINUTES_PROMPT = """Please create professional meeting minutes from the following transcript. Include:
+
+1. **Meeting Summary**: Brief overview of the main topics discussed
+2. **Key Decisions**: Important decisions made during the meeting  
+3. **Action Items**: Tasks assigned with responsible parties (if mentioned)
+4. **Next Steps**: Planned follow-up actions or next meetings
+
+Format the output in clear, professional language suitable for business documentation.
+Language: Generate the minutes in {language}.
+
+Transcript:
+{transcript}"""
+
+# Prompt used when the configured template has no {transcript} placeholder
+FALLBACK_MINUTES_PROMPT_PREFIX = """Please create professional meeting minutes from the following transcript. Include:
+
+1. **Meeting Summary**: Brief overview of the main topics discussed
+2. **Key Decisions**: Important decisions made during the meeting
+3. **Action Items**: Tasks assigned with responsible parties (if mentioned)
+4. **Next Steps**: Planned follow-up actions or next meetings
+
+Format the output in clear, professional language suitable for business documentation.
+
+Transcript:
+"""
+
+# Choices for the CIRCUIT API model and minutes language in the Settings tab
+CIRCUIT_MODELS = (
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-4.1",
+    "o4-mini",
+    "o3",
+    "gemini-2.5-flash",
+    "gemini-2.5-pro",
+)
+# Saved model names normalized to a CIRCUIT_MODELS entry (case-insensitive,
+# ignoring any " (...)" label suffix such as a pricing tier)
+_CIRCUIT_MODEL_LOOKUP = {name.casefold(): name for name in CIRCUIT_MODELS}
+MINUTES_LANGUAGES = ("Auto (from transcript)", "English", "Japanese", "Chinese", "Spanish", "French", "German", "Korean")
+
+# Size limit for the on-disk transcript cache before least recently used entries are evicted
+TRANSCRIPT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Transcripts longer than this are inserted into the Text widget in idle-time chunks
+TEXT_INSERT_CHUNK = 64 * 1024
+
+# Characters of minutes encoded per write when saving
+MINUTES_WRITE_CHUNK = 1024 * 1024
+
+# Bundle identifier of the packaged app (see MLXWhisperGUI.spec)
+APP_BUNDLE_ID = "com.mlx.whisper.gui"
+
+# AppleScript snippets tried in order to bring an already running instance to the front
+FOCUS_SCRIPTS = (
+    # By application name
+    'tell application "MLXWhisperGUI" to activate',
+    # By process name
+    'tell application "System Events" to tell process "MLXWhisperGUI" to set frontmost to true',
+    # Any MLX Whisper window
+    '''tell application "System Events"
+        set procs to every process whose name contains "MLX" or name contains "Whisper"
+        if length of procs > 0 then
+            set frontmost of item 1 of procs to true
+        end if
+    end tell''',
+)
+
+# Index of the FOCUS_SCRIPTS entry that last worked, per platform; also persisted on disk
+_FOCUS_STRATEGY_CACHE = {}
 
 
 class ProcessManager:
@@ -50,14 +163,14 @@ class ProcessManager:
         atexit.register(self.cleanup_all)
         
         # Set up signal handlers for graceful shutdown
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             signal.signal(signal.SIGTERM, self._signal_handler)
             signal.signal(signal.SIGINT, self._signal_handler)
             signal.signal(signal.SIGPIPE, signal.SIG_IGN)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
-        print(f"Debug: ProcessManager received signal {signum}, cleaning up...")
+        log.debug("ProcessManager received signal %s, cleaning up...", signum)
         self.cleanup_all()
     
     def register_process(self, process):
@@ -68,7 +181,7 @@ class ProcessManager:
     
     def create_process_group(self):
         """Create a new process group for better isolation"""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             try:
                 # Create new process group
                 pgid = os.setpgrp()
@@ -79,7 +192,11 @@ class ProcessManager:
         return None
     
     def kill_ffmpeg_processes(self, force=False):
-        """Kill only stale or orphaned ffmpeg processes, not active transcription ones"""
+        """Kill only stale or orphaned ffmpeg processes, not active transcription ones
+        
+        Only this process's own ffmpeg children are considered, including those
+        mlx_whisper spawns itself; other applications' ffmpeg is never touched.
+        """
         with self.lock:
             # Throttle ffmpeg killing to prevent excessive calls
             current_time = time.time()
@@ -90,7 +207,7 @@ class ProcessManager:
         
         # Only kill stale processes if forced (app shutdown) or if not currently transcribing
         if not force and hasattr(self, '_transcribing') and self._transcribing:
-            print("Debug: Skipping ffmpeg cleanup during active transcription")
+            log.debug("Skipping ffmpeg cleanup during active transcription")
             return
         
         try:
@@ -98,12 +215,12 @@ class ProcessManager:
             killed_count = 0
             current_time = time.time()
             
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
+            for proc in psutil.Process().children(recursive=True):
                 try:
-                    proc_info = proc.info
-                    proc_name = proc_info.get('name', '').lower()
-                    cmdline = proc_info.get('cmdline', [])
-                    create_time = proc_info.get('create_time', 0)
+                    proc_info = proc.as_dict(['pid', 'name', 'cmdline', 'create_time'])
+                    proc_name = (proc_info.get('name') or '').lower()
+                    cmdline = proc_info.get('cmdline') or []
+                    create_time = proc_info.get('create_time') or 0
                     
                     # Check if it's an ffmpeg process
                     if ('ffmpeg' in proc_name or 
@@ -113,7 +230,7 @@ class ProcessManager:
                         # or if force=True (app shutdown)
                         process_age = current_time - create_time
                         if force or process_age > 300:  # 5 minutes
-                            print(f"Debug: Killing stale ffmpeg process {proc_info['pid']} (age: {process_age:.1f}s)")
+                            log.debug("Killing stale ffmpeg process %s (age: %.1fs)", proc_info['pid'], process_age)
                             try:
                                 proc.terminate()
                                 proc.wait(timeout=2)
@@ -124,17 +241,31 @@ class ProcessManager:
                             except (psutil.NoSuchProcess, psutil.AccessDenied):
                                 pass
                         else:
-                            print(f"Debug: Keeping active ffmpeg process {proc_info['pid']} (age: {process_age:.1f}s)")
+                            log.debug("Keeping active ffmpeg process %s (age: %.1fs)", proc_info['pid'], process_age)
                             
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
             if killed_count > 0:
-                print(f"Debug: Killed {killed_count} stale ffmpeg processes")
+                log.debug("Killed %s stale ffmpeg processes", killed_count)
                 
         except ImportError:
-            # Avoid using pkill/killall as they can interfere with other applications
-            print("Debug: psutil not available, skipping ffmpeg cleanup to prevent interference")
+            # Avoid using pkill/killall as they can interfere with other applications;
+            # without psutil only the processes registered with us can be found
+            if force:
+                with self.lock:
+                    procs = [ref() for ref in self.active_processes]
+                for proc in procs:
+                    if proc and proc.poll() is None:
+                        try:
+                            proc.terminate()
+                            proc.wait(timeout=2)
+                        except subprocess.TimeoutExpired:
+                            proc.kill()
+                        except OSError:
+                            pass
+            else:
+                log.debug("psutil not available, skipping stale ffmpeg cleanup")
     
     def cleanup_all(self):
         """Clean up all tracked processes and process groups - quick version"""
@@ -167,7 +298,7 @@ class ProcessManager:
                     except (OSError, ProcessLookupError):
                         pass
         except Exception as e:
-            print(f"Debug: Quick cleanup error: {e}")
+            log.debug("Quick cleanup error: %s", e)
             # Don't let cleanup errors block shutdown
             
             self.active_processes.clear()
@@ -180,29 +311,33 @@ class ProcessManager:
                 self.monitoring_enabled = True
                 self.monitor_thread = threading.Thread(target=self._monitor_processes, daemon=True)
                 self.monitor_thread.start()
-                print("Debug: ProcessManager monitoring started")
+                log.debug("ProcessManager monitoring started")
     
     def _monitor_processes(self):
         """Background process monitoring"""
+        # Orphaned ffmpeg processes can only be left over from previous runs, so the
+        # system-wide scan happens once; our own children are handled by kill_ffmpeg_processes
+        orphan_check_done = False
         while self.monitoring_enabled:
             try:
                 with self.lock:
                     # Clean up dead process references
                     self.active_processes = [ref for ref in self.active_processes if ref() is not None]
                 
-                # Check for orphaned ffmpeg processes every 30 seconds (reduced frequency)
-                self._check_orphaned_ffmpeg()
+                if not orphan_check_done:
+                    self._check_orphaned_ffmpeg()
+                    orphan_check_done = not self._transcribing
                 
                 time.sleep(30)
             except Exception as e:
-                print(f"Debug: Process monitoring error: {e}")
+                log.debug("Process monitoring error: %s", e)
                 time.sleep(5)
     
     def _check_orphaned_ffmpeg(self):
         """Check for and clean up truly orphaned ffmpeg processes"""
         # Skip if currently transcribing to avoid killing active processes
         if hasattr(self, '_transcribing') and self._transcribing:
-            print("Debug: Skipping orphaned ffmpeg check during active transcription")
+            log.debug("Skipping orphaned ffmpeg check during active transcription")
             return
             
         try:
@@ -224,7 +359,7 @@ class ProcessManager:
                             parent = proc.parent()
                             # Check if parent exists and is our application
                             if parent is None or not parent.is_running():
-                                print(f"Debug: Found orphaned ffmpeg process {proc_info['pid']} - parent is dead")
+                                log.debug("Found orphaned ffmpeg process %s - parent is dead", proc_info['pid'])
                                 proc.terminate()
                                 proc.wait(timeout=2)
                             else:
@@ -232,10 +367,10 @@ class ProcessManager:
                                 parent_cmdline = parent.cmdline()
                                 if parent_cmdline and not any(app_name in str(cmd) for cmd in parent_cmdline):
                                     # Parent exists but is not our app - likely inherited from another process
-                                    print(f"Debug: Found ffmpeg process {proc_info['pid']} with foreign parent {parent.pid}")
+                                    log.debug("Found ffmpeg process %s with foreign parent %s", proc_info['pid'], parent.pid)
                                     # Don't terminate - might be from another legitimate application
                                 else:
-                                    print(f"Debug: Keeping ffmpeg process {proc_info['pid']} with valid parent {parent.pid}")
+                                    log.debug("Keeping ffmpeg process %s with valid parent %s", proc_info['pid'], parent.pid)
                         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
                             pass
                                 
@@ -288,40 +423,40 @@ class SingleInstanceLock:
             return False
             
         except Exception as e:
-            print(f"Debug: Lock acquisition failed: {e}")
+            log.debug("Lock acquisition failed: %s", e)
             return False
     
     def _check_existing_instance(self):
         """Check if another instance is already running"""
         try:
             # Check PID file first
-            if platform.system() == "Darwin":
-                pid_dir = os.path.expanduser("~/Library/Application Support/MLXWhisperGUI")
+            if _PLATFORM == "Darwin":
+                pid_dir = _LOCK_DIR
             else:
                 pid_dir = tempfile.gettempdir()
             
             pid_file = os.path.join(pid_dir, f"{self.app_name}.pid")
             
-            if os.path.exists(pid_file):
+            # A single open() both checks for and reads the PID file
+            try:
+                with open(pid_file, 'r') as f:
+                    pid = int(f.readline().strip())
+            except (ValueError, OSError):
+                return False
+            
+            # Check if process is still running
+            try:
+                os.kill(pid, 0)  # Signal 0 just checks if process exists
+                # Process exists, check if it's our application
+                import psutil
+                proc = psutil.Process(pid)
+                if 'MLXWhisperGUI' in proc.name() or 'whisper' in proc.name().lower():
+                    return True
+            except (OSError, ProcessLookupError, psutil.NoSuchProcess):
+                # Process is dead, clean up stale PID file
                 try:
-                    with open(pid_file, 'r') as f:
-                        pid = int(f.read().strip())
-                    
-                    # Check if process is still running
-                    try:
-                        os.kill(pid, 0)  # Signal 0 just checks if process exists
-                        # Process exists, check if it's our application
-                        import psutil
-                        proc = psutil.Process(pid)
-                        if 'MLXWhisperGUI' in proc.name() or 'whisper' in proc.name().lower():
-                            return True
-                    except (OSError, ProcessLookupError, psutil.NoSuchProcess):
-                        # Process is dead, clean up stale PID file
-                        try:
-                            os.remove(pid_file)
-                        except:
-                            pass
-                except (ValueError, IOError):
+                    os.remove(pid_file)
+                except:
                     pass
             
             return False
@@ -333,9 +468,9 @@ class SingleInstanceLock:
         """Try to acquire exclusive file lock"""
         try:
             # Create lock directory if it doesn't exist
-            if platform.system() == "Darwin":
+            if _PLATFORM == "Darwin":
                 # Use ~/Library/Application Support on macOS
-                lock_dir = os.path.expanduser("~/Library/Application Support/MLXWhisperGUI")
+                lock_dir = _LOCK_DIR
             else:
                 # Use system temp directory on other platforms
                 lock_dir = tempfile.gettempdir()
@@ -343,15 +478,16 @@ class SingleInstanceLock:
             os.makedirs(lock_dir, exist_ok=True)
             self.lock_file_path = os.path.join(lock_dir, f"{self.app_name}.lock")
             
-            # Open file for exclusive access
-            self.lock_file_handle = open(self.lock_file_path, 'w')
+            # Open without truncating: a losing instance must not wipe the
+            # holder's info, and the winner rewrites it in place below
+            self.lock_file_handle = os.fdopen(
+                os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT, 0o644), 'r+')
             
             # Try to acquire exclusive lock (non-blocking)
             fcntl.flock(self.lock_file_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
             
             # Write current process info
-            self.lock_file_handle.write(f"{os.getpid()}\n{time.time()}\n{self.app_name}")
-            self.lock_file_handle.flush()
+            self._write_lock_state(self.app_name)
             
             return True
             
@@ -365,6 +501,13 @@ class SingleInstanceLock:
                 self.lock_file_handle = None
             return False
     
+    def _write_lock_state(self, tag):
+        """Overwrite the lock file contents with a single positioned write"""
+        payload = f"{os.getpid()}\n{time.time()}\n{tag}".encode()
+        fd = self.lock_file_handle.fileno()
+        os.pwrite(fd, payload, 0)
+        os.ftruncate(fd, len(payload))
+    
     def _try_socket_lock(self):
         """Try to acquire socket-based lock as secondary verification"""
         try:
@@ -390,8 +533,8 @@ class SingleInstanceLock:
     def _write_pid_file(self):
         """Write PID file for additional verification"""
         try:
-            if platform.system() == "Darwin":
-                pid_dir = os.path.expanduser("~/Library/Application Support/MLXWhisperGUI")
+            if _PLATFORM == "Darwin":
+                pid_dir = _LOCK_DIR
             else:
                 pid_dir = tempfile.gettempdir()
             
@@ -399,28 +542,28 @@ class SingleInstanceLock:
             self.pid_file_path = os.path.join(pid_dir, f"{self.app_name}.pid")
             
             # Check if PID file exists and process is still running
-            if os.path.exists(self.pid_file_path):
+            try:
+                with open(self.pid_file_path, 'r') as f:
+                    old_pid = int(f.readline().strip())
+            except (ValueError, OSError):
+                old_pid = None  # Missing or invalid PID file
+            
+            if old_pid is not None:
                 try:
-                    with open(self.pid_file_path, 'r') as f:
-                        old_pid = int(f.read().strip())
-                    
-                    # Check if process is still running
-                    try:
-                        os.kill(old_pid, 0)  # Signal 0 just checks if process exists
-                        return False  # Process is still running
-                    except (OSError, ProcessLookupError):
-                        # Process is dead, remove stale PID file
-                        os.remove(self.pid_file_path)
-                except (ValueError, IOError):
-                    # Invalid PID file, remove it
-                    try:
-                        os.remove(self.pid_file_path)
-                    except:
-                        pass
+                    os.kill(old_pid, 0)  # Signal 0 just checks if process exists
+                    return False  # Process is still running
+                except (OSError, ProcessLookupError):
+                    pass  # Process is dead, stale PID file is replaced below
             
-            # Write current PID
-            with open(self.pid_file_path, 'w') as f:
-                f.write(str(os.getpid()))
+            # Write current PID atomically so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=pid_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(str(os.getpid()))
+                os.replace(tmp_path, self.pid_file_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
             
             return True
             
@@ -470,7 +613,7 @@ class SingleInstanceLock:
                     pass
                     
         except Exception as e:
-            print(f"Debug: Lock release error: {e}")
+            log.debug("Lock release error: %s", e)
     
     def is_another_instance_running(self):
         """Check if another instance is already running"""
@@ -497,12 +640,12 @@ class SingleInstanceLock:
     def _setup_process_group(self):
         """Set up process group for better child process management"""
         try:
-            if platform.system() != "Windows":
+            if not _IS_WINDOWS:
                 # Create a new process group on Unix systems
                 self.process_group_id = os.getpid()
                 os.setpgrp()  # Make this process the group leader
         except Exception as e:
-            print(f"Debug: Failed to set up process group: {e}")
+            log.debug("Failed to set up process group: %s", e)
 
     def _cleanup_stale_processes(self):
         """Clean up only truly stale/zombie processes that might interfere"""
@@ -524,7 +667,7 @@ class SingleInstanceLock:
                         is_our_app = any(self.app_name.lower() in str(arg).lower() for arg in cmdline)
                         
                         if is_our_app:
-                            print(f"Debug: Cleaning up zombie process {proc.info['pid']}")
+                            log.debug("Cleaning up zombie process %s", proc.info['pid'])
                             try:
                                 proc.terminate()
                                 proc.wait(timeout=1)
@@ -538,19 +681,19 @@ class SingleInstanceLock:
             # psutil not available, use basic cleanup
             self._basic_process_cleanup()
         except Exception as e:
-            print(f"Debug: Error cleaning up stale processes: {e}")
+            log.debug("Error cleaning up stale processes: %s", e)
     
     def _basic_process_cleanup(self):
         """Basic process cleanup without psutil - minimalistic approach"""
         try:
             # Don't use pkill as it can kill legitimate processes
             # Only clean up what we can safely identify as ours
-            print("Debug: Skipping aggressive process cleanup to prevent interference")
+            log.debug("Skipping aggressive process cleanup to prevent interference")
         except Exception:
             pass
     
         except Exception as e:
-            print(f"Debug: Error cleaning up process group: {e}")
+            log.debug("Error cleaning up process group: %s", e)
     
     def register_child_process(self, process):
         """Register a child process for cleanup (deprecated - use ProcessManager)"""
@@ -558,6 +701,109 @@ class SingleInstanceLock:
         return self.process_manager.register_process(process)
 
 
+class TranscriptCache:
+    """On-disk cache of transcription results keyed by audio content, model and language"""
+    def __init__(self, cache_dir=None, max_bytes=TRANSCRIPT_CACHE_MAX_BYTES):
+        if cache_dir is None:
+            if _PLATFORM == "Darwin":
+                cache_dir = os.path.expanduser("~/Library/Caches/MLXWhisperGUI")
+            else:
+                cache_dir = os.path.join(tempfile.gettempdir(), "MLXWhisperGUI-cache")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+    
+    def key(self, file_path, model_name, language):
+        """Build a cache key from a streaming hash of the audio file
+        
+        Uses blake3 when installed and sha256 otherwise; the algorithm is part
+        of the key so entries from one never match the other.
+        """
+        if blake3 is not None:
+            algo, digest = "b3", blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            algo, digest = "sha256", hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(4 * 1024 * 1024), b''):
+                digest.update(chunk)
+        return f"v1:{algo}:{digest.hexdigest()}:{model_name}:{language or 'auto'}"
+    
+    def _entry_path(self, key):
+        """Map a cache key to a file name that is safe on any filesystem"""
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json.gz")
+    
+    def lookup(self, key):
+        """Return the cached result for key, or None on a miss"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        try:
+            result = json.loads(gzip.decompress(data))
+        except (OSError, EOFError, zlib.error, ValueError) as e:
+            # Truncated or corrupt entry: drop it so the file is transcribed again
+            log.debug("Discarding damaged cache entry %s: %s", entry_path, e)
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                pass
+            return None
+        
+        try:
+            os.utime(entry_path)  # Mark as recently used
+        except OSError:
+            pass
+        return result
+    
+    def store(self, key, result):
+        """Atomically write a result to the cache and enforce the size limit"""
+        try:
+            payload = gzip.compress(json.dumps(result).encode('utf-8'))
+        except (TypeError, ValueError) as e:
+            log.debug("Transcript not cacheable: %s", e)
+            return
+        
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._entry_path(key))
+            self._evict()
+        except OSError as e:
+            log.debug("Transcript cache write error: %s", e)
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _evict(self):
+        """Remove least recently used entries while the cache is over max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json.gz'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError:
+                pass
+
+
 def setup_ffmpeg_path():
     """Setup FFmpeg path for PyInstaller bundle"""
     if getattr(sys, 'frozen', False):
@@ -587,14 +833,87 @@ def setup_ffmpeg_path():
     os.environ['PYTHONUNBUFFERED'] = '1'  # Ensure output is not buffered
     
     # Set up signal handling for child processes
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         # Ignore SIGPIPE to prevent ffmpeg issues
         signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
 
+# Environment for better process isolation while MLX Whisper runs
+MLX_ENV = {
+    'PYTHONUNBUFFERED': '1',
+    'MLX_DISABLE_METAL_CAPTURE': '1',  # Prevent Metal capture issues
+    'OBJC_DISABLE_INITIALIZE_FORK_SAFETY': 'YES',  # macOS fork safety
+}
+
+
+def decode_audio(file_path, sample_rate=16000):
+    """Decode an audio file to mono float32 PCM with ffmpeg, as MLX Whisper expects"""
+    cmd = [
+        os.environ.get('FFMPEG_BINARY', 'ffmpeg'), "-nostdin", "-threads", "0", "-i", file_path,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate), "-"
+    ]
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_SUBPROCESS_KWARGS)
+    ProcessManager().register_process(process)
+    out, err = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"Failed to load audio: {err.decode(errors='ignore').strip()}")
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+@contextlib.contextmanager
+def mlx_progress_hook(callback):
+    """Report real decoding progress (0.0-1.0) from mlx_whisper's internal tqdm bar
+    
+    Yields False without patching anything if mlx_whisper's transcribe module
+    doesn't drive a tqdm progress bar, so callers can fall back to estimates.
+    """
+    module = sys.modules.get("mlx_whisper.transcribe")
+    tqdm_module = getattr(module, "tqdm", None)
+    if not isinstance(getattr(tqdm_module, "tqdm", None), type):
+        yield False
+        return
+    
+    class ProgressBar(tqdm_module.tqdm):
+        def __init__(self, *args, **kwargs):
+            # Always track progress, but render the bar into a throwaway buffer
+            kwargs.update(disable=False, file=io.StringIO(), mininterval=float("inf"))
+            super().__init__(*args, **kwargs)
+        
+        def update(self, n=1):
+            displayed = super().update(n)
+            if self.total:
+                callback(min(self.n / self.total, 1.0))
+            return displayed
+    
+    module.tqdm = types.SimpleNamespace(tqdm=ProgressBar)
+    try:
+        yield True
+    finally:
+        module.tqdm = tqdm_module
+
+
+def preload_whisper_model(model_name):
+    """Load model weights into mlx_whisper's model cache before the first transcribe() call
+    
+    transcribe() only accepts a repo name and reuses the last model loaded
+    through ModelHolder, so warming that cache is how a model is loaded once.
+    Returns False if this mlx_whisper version has no ModelHolder.
+    """
+    try:
+        import mlx.core as mx
+        from mlx_whisper.transcribe import ModelHolder
+    except ImportError:
+        return False
+    # transcribe() requests float16 weights unless fp16=False is passed
+    ModelHolder.get_model(model_name, mx.float16)
+    return True
+
+
 class WhisperGUI:
     def __init__(self):
         self.root = tk.Tk()
+        # Keep the window hidden while widgets are built so no intermediate layouts are drawn
+        self.root.withdraw()
         self.root.title("MLX Whisper GUI - Audio Transcription")
         self.root.geometry("800x600")
         self.root.minsize(600, 400)
@@ -605,12 +924,24 @@ class WhisperGUI:
         # Initialize global process manager
         self.process_manager = ProcessManager()
         
+        # Cache of previous transcription results
+        self.transcript_cache = TranscriptCache()
+        
+        # Shared HTTP session so CIRCUIT API calls reuse keep-alive connections
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        
+        # Cached CIRCUIT OAuth2 access token and the time it should be refreshed
+        self._token = None
+        self._token_exp = 0
+        
+        # Set environment variables for better process isolation once for the
+        # whole session instead of around every transcription
+        os.environ.update(MLX_ENV)
+        
         # Start process monitoring (once per application)
         self.process_manager.start_monitoring()
         
-        # Set up process monitoring
-        self._setup_process_monitoring()
-        
         # Set up window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -623,8 +954,30 @@ class WhisperGUI:
         self.batch_files = []
         self.audio_duration = 0  # Duration in seconds
         self.transcription_start_time = 0  # Start time for ETA calculation
-        self.eta_history = []  # Store ETA calculations for smoothing
+        self.eta_history = deque(maxlen=5)  # Last 5 ETA calculations for smoothing
         self.processing_stage = "idle"  # Track current processing stage
+        self._ffprobe_cmd = None  # Resolved ffprobe path, looked up on first use
+        self._result_text_pending = deque()  # (text, offset) pairs waiting to be appended to result_text
+        self._result_text_draining = False
+        self._can_generate_cached = None  # Last state applied to the Generate Minutes button
+        self._minutes_button_update_pending = False
+        
+        # CIRCUIT API settings (widgets live in the lazily built Settings tab)
+        self.client_id_var = tk.StringVar()
+        self.client_secret_var = tk.StringVar()
+        self.app_key_var = tk.StringVar()
+        self.circuit_model_var = tk.StringVar(value="gpt-4o-mini")
+        self.minutes_language_var = tk.StringVar(value="Auto (from transcript)")
+        self.minutes_template = DEFAULT_MINUTES_PROMPT  # Used until the Settings tab is built
+        self._settings_loaded = False  # Settings are applied when a tab first needs them
+        self._loading_settings = False  # Suppresses credential traces while settings are applied
+        
+        # Cached inputs for the Generate Minutes button, kept up to date by
+        # variable traces and the transcript box's <<Modified>> event
+        self._circuit_ok = False
+        self._has_transcript = False
+        for var in (self.client_id_var, self.client_secret_var, self.app_key_var):
+            var.trace_add("write", self._recheck_minutes)
         
         # Available models - MLX large-v3 for highest accuracy
         self.models = ["large-v3"]
@@ -643,11 +996,13 @@ class WhisperGUI:
             "ko": "Korean",
             "zh": "Chinese"
         }
+        self._language_keys = tuple(self.languages.keys())
         
         self.create_widgets()
         
-        # Load saved settings
-        self.load_settings()
+        # Run a single layout pass and show the fully built window
+        self.root.update_idletasks()
+        self.root.deiconify()
         
     def create_widgets(self):
         # Create notebook for tabs
@@ -658,10 +1013,41 @@ class WhisperGUI:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         
-        # Create tabs
+        # Create tabs - only the transcription tab is built up front, the others
+        # are placeholders that get filled in on first activation
         self.create_transcription_tab()
-        self.create_minutes_tab()
-        self.create_settings_tab()
+        self.minutes_frame = self._create_tab_stub("📝 Meeting Minutes")
+        self.settings_frame = self._create_tab_stub("⚙️ Settings")
+        
+        # Bitmap of notebook tab indices whose contents have been built
+        self._tabs_built = 0b001
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_change)
+    
+    def _create_tab_stub(self, text):
+        """Add an empty tab frame with a placeholder label"""
+        frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(frame, text=text)
+        ttk.Label(frame, text="Loading...", foreground='gray').grid(row=0, column=0, sticky=tk.W)
+        return frame
+    
+    def _on_tab_change(self, event=None):
+        """Build the contents of a tab the first time it is selected"""
+        index = self.notebook.index('current')
+        if self._tabs_built & (1 << index):
+            return
+        self._tabs_built |= 1 << index
+        
+        if index == 1:
+            frame, builder = self.minutes_frame, self.create_minutes_tab
+        elif index == 2:
+            frame, builder = self.settings_frame, self.create_settings_tab
+        else:
+            return
+        
+        # Remove the placeholder label before building the real widgets
+        for child in frame.winfo_children():
+            child.destroy()
+        builder(frame)
     
     def create_transcription_tab(self):
         # Main transcription frame
@@ -692,7 +1078,7 @@ class WhisperGUI:
         # Language selection
         ttk.Label(main_frame, text="Language:").grid(row=2, column=0, sticky=tk.W, pady=(0, 5))
         language_combo = ttk.Combobox(main_frame, textvariable=self.language_var, 
-                                    values=list(self.languages.keys()), state="readonly")
+                                    values=self._language_keys, state="readonly")
         language_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Auto-save option
@@ -731,6 +1117,7 @@ class WhisperGUI:
         
         self.result_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, height=15)
         self.result_text.grid(row=6, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
+        self.result_text.bind('<<Modified>>', self._on_result_modified)
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -738,10 +1125,9 @@ class WhisperGUI:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
     
-    def create_minutes_tab(self):
-        # Meeting minutes frame
-        minutes_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(minutes_frame, text="📝 Meeting Minutes")
+    def create_minutes_tab(self, minutes_frame):
+        # Credentials and minutes options are needed from here on
+        self._ensure_settings_loaded()
         
         # Configure grid weights
         minutes_frame.columnconfigure(0, weight=1)
@@ -784,11 +1170,13 @@ class WhisperGUI:
         self.copy_minutes_btn = ttk.Button(save_minutes_frame, text="📋 Copy Minutes", 
                                           command=self.copy_minutes, state=tk.DISABLED)
         self.copy_minutes_btn.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # A transcript may already exist if this tab is opened after transcribing
+        self.update_minutes_button_state()
     
-    def create_settings_tab(self):
-        # Settings frame
-        settings_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(settings_frame, text="⚙️ Settings")
+    def create_settings_tab(self, settings_frame):
+        # Load saved settings first so the widgets start with the saved values
+        self._ensure_settings_loaded()
         
         # Configure grid weights
         settings_frame.columnconfigure(1, weight=1)
@@ -800,42 +1188,29 @@ class WhisperGUI:
         
         # Client ID
         ttk.Label(api_group, text="Client ID:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        self.client_id_var = tk.StringVar()
         self.client_id_entry = ttk.Entry(api_group, textvariable=self.client_id_var, width=50)
         self.client_id_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Client Secret
         ttk.Label(api_group, text="Client Secret:").grid(row=1, column=0, sticky=tk.W, pady=(0, 5))
-        self.client_secret_var = tk.StringVar()
         self.client_secret_entry = ttk.Entry(api_group, textvariable=self.client_secret_var, show="*", width=50)
         self.client_secret_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # App Key
         ttk.Label(api_group, text="App Key:").grid(row=2, column=0, sticky=tk.W, pady=(0, 5))
-        self.app_key_var = tk.StringVar()
         self.app_key_entry = ttk.Entry(api_group, textvariable=self.app_key_var, width=50)
         self.app_key_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Model selection for CIRCUIT API
         ttk.Label(api_group, text="Model:").grid(row=3, column=0, sticky=tk.W, pady=(0, 5))
-        self.circuit_model_var = tk.StringVar(value="gpt-4o-mini")
         model_combo = ttk.Combobox(api_group, textvariable=self.circuit_model_var, 
-                                  values=[
-                                      "gpt-4o",
-                                      "gpt-4o-mini", 
-                                      "gpt-4.1",
-                                      "o4-mini",
-                                      "o3",
-                                      "gemini-2.5-flash",
-                                      "gemini-2.5-pro"
-                                  ], state="readonly")
+                                  values=CIRCUIT_MODELS, state="readonly")
         model_combo.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Language selection for minutes
         ttk.Label(api_group, text="Minutes Language:").grid(row=4, column=0, sticky=tk.W, pady=(0, 5))
-        self.minutes_language_var = tk.StringVar(value="Auto (from transcript)")
         language_combo = ttk.Combobox(api_group, textvariable=self.minutes_language_var, 
-                                    values=["Auto (from transcript)", "English", "Japanese", "Chinese", "Spanish", "French", "German", "Korean"], state="readonly")
+                                    values=MINUTES_LANGUAGES, state="readonly")
         language_combo.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Test connection button
@@ -850,30 +1225,14 @@ class WhisperGUI:
         
         ttk.Label(prompt_group, text="Minutes Generation Template:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         
-        self.minutes_prompt_var = tk.StringVar(value="""Please create professional meeting minutes from the following transcript. Include:
-
-1. **Meeting Summary**: Brief overview of the main topics discussed
-2. **Key Decisions**: Important decisions made during the meeting  
-3. **Action Items**: Tasks assigned with responsible parties (if mentioned)
-4. **Next Steps**: Planned follow-up actions or next meetings
-
-Format the output in clear, professional language suitable for business documentation.
-Language: Generate the minutes in {language}.
-
-Transcript:
-{transcript}""")
-        
         self.minutes_prompt_text = scrolledtext.ScrolledText(prompt_group, wrap=tk.WORD, height=12)
         self.minutes_prompt_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.minutes_prompt_text.insert('1.0', self.minutes_prompt_var.get())
+        self.minutes_prompt_text.insert('1.0', self.minutes_template)
         
         # Save settings button
         ttk.Button(settings_frame, text="💾 Save Settings", 
                   command=self.save_settings).grid(row=2, column=0, columnspan=2, pady=(10, 0))
         
-        # Load saved settings
-        self.load_settings()
-        
     def browse_file(self):
         """Open file browser to select audio file"""
         file_types = [
@@ -900,36 +1259,34 @@ Transcript:
     def get_audio_duration(self, file_path):
         """Get audio file duration in seconds using ffprobe"""
         try:
-            # Try to find ffprobe in bundled app first
-            ffprobe_cmd = "ffprobe"
-            if getattr(sys, 'frozen', False):
-                # Running in PyInstaller bundle
-                bundle_dir = sys._MEIPASS
-                ffprobe_path = os.path.join(bundle_dir, 'ffprobe')
-                if os.path.exists(ffprobe_path):
-                    ffprobe_cmd = ffprobe_path
-                else:
-                    # Try the Resources directory
-                    resources_dir = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
-                    ffprobe_path = os.path.join(resources_dir, 'ffprobe')
+            if self._ffprobe_cmd is None:
+                # Try to find ffprobe in bundled app first
+                ffprobe_cmd = "ffprobe"
+                if getattr(sys, 'frozen', False):
+                    # Running in PyInstaller bundle
+                    bundle_dir = sys._MEIPASS
+                    ffprobe_path = os.path.join(bundle_dir, 'ffprobe')
                     if os.path.exists(ffprobe_path):
                         ffprobe_cmd = ffprobe_path
-            
-            # Use ffprobe to get audio duration
+                    else:
+                        # Try the Resources directory
+                        resources_dir = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
+                        ffprobe_path = os.path.join(resources_dir, 'ffprobe')
+                        if os.path.exists(ffprobe_path):
+                            ffprobe_cmd = ffprobe_path
+                self._ffprobe_cmd = ffprobe_cmd
+            
+            # Use ffprobe to print only the container duration as a bare number
             cmd = [
-                ffprobe_cmd, "-v", "quiet", "-print_format", "json", 
-                "-show_format", file_path
+                self._ffprobe_cmd, "-v", "error", "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1", file_path
             ]
             # Use better process management for ffmpeg
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                  creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if platform.system() == "Windows" else 0,
-                                  start_new_session=True if platform.system() != "Windows" else False)
+            result = subprocess.run(cmd, capture_output=True, text=True, **_SUBPROCESS_KWARGS)
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                duration = float(data['format']['duration'])
-                return int(duration)
+                return int(float(result.stdout.strip()))
         except Exception as e:
-            print(f"Debug: ffprobe error: {e}")
+            log.debug("ffprobe error: %s", e)
         return 0
     
     def start_transcription(self):
@@ -967,15 +1324,12 @@ Transcript:
     
     def calculate_smooth_eta(self, current_eta):
         """Calculate smoothed ETA to reduce fluctuations"""
+        # The deque keeps only the last 5 ETA calculations for smoothing
         self.eta_history.append(current_eta)
-        # Keep only last 5 ETA calculations for smoothing
-        if len(self.eta_history) > 5:
-            self.eta_history.pop(0)
         
         # Return median of recent ETAs for stability
         if len(self.eta_history) >= 3:
-            sorted_etas = sorted(self.eta_history)
-            return sorted_etas[len(sorted_etas) // 2]
+            return median_low(self.eta_history)
         else:
             return current_eta
 
@@ -1049,19 +1403,24 @@ Transcript:
             self.progress_var.set(98)
             self.progress_label.config(text="Finalizing transcript... (almost done!)")
     
+    def _real_progress(self, progress):
+        """Show progress reported by MLX Whisper's decoding loop"""
+        elapsed = time.time() - self.transcription_start_time
+        self.update_progress_simulation("processing", progress, elapsed)
+    
     def transcribe_audio(self):
         """Perform audio transcription using MLX Whisper"""
         try:
             # Set transcription state to prevent ffmpeg cleanup during processing
             self.process_manager._transcribing = True
-            print("Debug: Started transcription - ffmpeg cleanup disabled")
+            log.debug("Started transcription - ffmpeg cleanup disabled")
             
             model_name = self.model_var.get()
             language = self.language_var.get() if self.language_var.get() != "auto" else None
             
             # Create new process group for isolation
             pgid = self.process_manager.create_process_group()
-            print(f"Debug: Created process group {pgid} for transcription")
+            log.debug("Created process group %s for transcription", pgid)
             
             # Load MLX model
             self.root.after(0, lambda: self.status_var.set(f"Loading {model_name} model..."))
@@ -1075,7 +1434,7 @@ Transcript:
             start_time = time.time()
             self.transcription_start_time = start_time
             
-            # Start enhanced progress tracking thread
+            # Fallback progress estimation thread
             def progress_updater():
                 last_update = 0
                 while self.is_processing:
@@ -1110,36 +1469,17 @@ Transcript:
                     
                     time.sleep(0.5)  # More frequent checks but less frequent updates
             
-            progress_thread = threading.Thread(target=progress_updater, daemon=True)
-            progress_thread.start()
-            
-            # Set environment variables for better process isolation
-            old_env = {}
-            try:
-                # Save original environment
-                for key in ['PYTHONUNBUFFERED', 'MLX_DISABLE_METAL_CAPTURE', 'OBJC_DISABLE_INITIALIZE_FORK_SAFETY']:
-                    old_env[key] = os.environ.get(key, None)
-                
-                # Set isolation variables
-                os.environ['PYTHONUNBUFFERED'] = '1'
-                os.environ['MLX_DISABLE_METAL_CAPTURE'] = '1'  # Prevent Metal capture issues
-                os.environ['OBJC_DISABLE_INITIALIZE_FORK_SAFETY'] = 'YES'  # macOS fork safety
+            # Follow MLX Whisper's own decoding progress when possible and only
+            # fall back to the wall-clock estimate thread when it can't be hooked
+            report_progress = lambda p: self.root.after(0, self._real_progress, p)
+            with mlx_progress_hook(report_progress) as hooked:
+                if not hooked:
+                    progress_thread = threading.Thread(target=progress_updater, daemon=True)
+                    progress_thread.start()
                 
-                print(f"Debug: Starting MLX Whisper transcription with process group {pgid}")
-                result = mlx_whisper.transcribe(
-                    self.selected_file.get(),
-                    path_or_hf_repo=mlx_model_name,
-                    language=language
-                )
-                print("Debug: MLX Whisper transcription completed successfully")
-                
-            finally:
-                # Restore original environment
-                for key, value in old_env.items():
-                    if value is None:
-                        os.environ.pop(key, None)
-                    else:
-                        os.environ[key] = value
+                log.debug("Starting MLX Whisper transcription with process group %s", pgid)
+                result = self._transcribe_cached(self.selected_file.get(), mlx_model_name, language)
+                log.debug("MLX Whisper transcription completed successfully")
             
             # Finalizing
             self.root.after(0, lambda: self.update_progress_simulation("finalizing"))
@@ -1154,20 +1494,45 @@ Transcript:
         finally:
             # Re-enable ffmpeg cleanup and clean up any remaining processes
             self.process_manager._transcribing = False
-            print("Debug: Transcription finished - re-enabling ffmpeg cleanup")
+            log.debug("Transcription finished - re-enabling ffmpeg cleanup")
             self.process_manager.kill_ffmpeg_processes(force=True)
             
             # Re-enable UI
             self.root.after(0, self.transcription_complete)
     
+    def _transcribe_cached(self, file_path, mlx_model_name, language):
+        """Transcribe with MLX Whisper, reusing the cached result for identical audio"""
+        try:
+            key = self.transcript_cache.key(file_path, mlx_model_name, language)
+        except OSError:
+            key = None  # Let mlx_whisper report unreadable files
+        
+        if key:
+            result = self.transcript_cache.lookup(key)
+            if result is not None:
+                log.debug("Transcript cache hit for %s", file_path)
+                return result
+        
+        result = mlx_whisper.transcribe(
+            file_path,
+            path_or_hf_repo=mlx_model_name,
+            language=language
+        )
+        if key:
+            self.transcript_cache.store(key, result)
+        return result
+    
     def display_results(self, result):
         """Display transcription results"""
-        # Clear previous results
-        self.result_text.delete(1.0, tk.END)
-        
-        # Insert transcript
+        # Replace previous results with the transcript
+        self.result_text.configure(state='normal')
         transcript = result.get("text", "").strip()
-        self.result_text.insert(tk.END, transcript)
+        self._clear_result_text()
+        self._queue_result_text(transcript)
+        self.result_text.see('1.0')
+        
+        # Don't keep the previous transcript alive in the undo stack
+        self.result_text.edit_reset()
         
         # Auto-save if enabled
         if self.auto_save_var.get() and transcript and self.selected_file.get():
@@ -1178,6 +1543,34 @@ Transcript:
         duration = len(segments)
         self.status_var.set(f"Transcription complete using MLX. {duration} segments processed.")
     
+    def _clear_result_text(self):
+        """Empty the transcript box and drop any text still queued for it"""
+        self._result_text_pending.clear()
+        self.result_text.delete('1.0', 'end')
+    
+    def _queue_result_text(self, text):
+        """Append text to the transcript box in order; the first chunk is shown
+        immediately and any remainder from idle callbacks"""
+        self._result_text_pending.append((text, 0))
+        if not self._result_text_draining:
+            self._result_text_draining = True
+            self._drain_result_text()
+    
+    def _drain_result_text(self):
+        """Insert the next chunk of queued transcript text"""
+        if not self._result_text_pending:
+            self._result_text_draining = False
+            return
+        text, start = self._result_text_pending.popleft()
+        end = start + TEXT_INSERT_CHUNK
+        self.result_text.insert('end', text[start:end])
+        if end < len(text):
+            self._result_text_pending.appendleft((text, end))
+        if self._result_text_pending:
+            self.root.after_idle(self._drain_result_text)
+        else:
+            self._result_text_draining = False
+    
     def show_error(self, error_msg):
         """Show error message"""
         messagebox.showerror("Transcription Error", error_msg)
@@ -1192,11 +1585,6 @@ Transcript:
         self.progress_bar.config(mode="determinate")
         self.progress_var.set(100)
         
-        # Enable meeting minutes button if transcript exists and CIRCUIT credentials are configured
-        if (hasattr(self, 'result_text') and self.result_text.get(1.0, tk.END).strip() and 
-            self.circuit_credentials_configured()):
-            self.generate_minutes_btn.config(state="normal")
-        
         # Calculate actual processing time
         if hasattr(self, 'transcription_start_time') and self.transcription_start_time > 0:
             total_time = time.time() - self.transcription_start_time
@@ -1222,7 +1610,7 @@ Transcript:
     
     def clear_results(self):
         """Clear transcription results"""
-        self.result_text.delete(1.0, tk.END)
+        self._clear_result_text()
         self.status_var.set("Results cleared")
     
     def save_transcript(self):
@@ -1241,8 +1629,7 @@ Transcript:
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                Path(file_path).write_bytes(content.encode('utf-8'))
                 self.status_var.set(f"Transcript saved to {os.path.basename(file_path)}")
                 messagebox.showinfo("Success", "Transcript saved successfully!")
             except Exception as e:
@@ -1306,18 +1693,65 @@ Transcript:
     
     def process_batch_files(self):
         """Process multiple files in batch"""
+        # Hashing and ffmpeg decoding of the next file run on a decode thread and
+        # overlap with MLX inference on the current one; the model preload,
+        # cache stores and auto-saves also run off this thread
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-io")
+        decode_q = SimpleQueue()
+        decode_slots = threading.Semaphore(1)  # Files decoded ahead of transcription
+        decode_stop = threading.Event()
+        decoder = None
+        self._batch_fh = None
         try:
             batch_start_time = time.time()
             total_files = len(self.batch_files)
-            all_transcripts = []
+            
+            # Settings can't change mid-batch (controls are disabled), so read them once
+            auto_save = self.auto_save_var.get()
+            lang = self.language_var.get()
+            language = None if lang == "auto" else lang
+            
+            # Results are streamed into the transcript box, and the batch results
+            # file if auto-save is enabled, as each file finishes
+            self.root.after(0, self._clear_result_text)
+            if auto_save:
+                self._batch_fh = self._open_batch_results_file()
+            
+            # Transcribe using MLX large-v3
+            mlx_model_name = "mlx-community/whisper-large-v3-mlx"
+            
+            # The weights are loaded once, on the first cache miss, so a batch of
+            # cache hits never touches MLX; loading overlaps that file's decode
+            model_load = []
+            model_load_lock = threading.Lock()
+            
+            def on_cache_miss():
+                with model_load_lock:
+                    if not model_load:
+                        self.root.after(0, self.status_var.set, "Loading large-v3 model...")
+                        model_load.append(executor.submit(preload_whisper_model, mlx_model_name))
+            
+            last_ui_update = 0.0
+            if total_files:
+                decoder = threading.Thread(
+                    target=self._decode_batch_files,
+                    args=(list(self.batch_files), mlx_model_name, language,
+                          decode_q, decode_slots, decode_stop, on_cache_miss),
+                    name="decode", daemon=True)
+                decoder.start()
             
             for i, file_path in enumerate(self.batch_files):
                 if not self.is_processing:  # Check if cancelled
                     break
                 
+                # Take this file's preload, which lets the decoder start on the next one
+                loaded = decode_q.get()
+                if loaded is None:  # Decoder stopped early (cancelled)
+                    break
+                decode_slots.release()
+                
                 # Update progress with ETA
                 progress = (i / total_files) * 100
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
                 
                 filename = os.path.basename(file_path)
                 
@@ -1333,79 +1767,131 @@ Transcript:
                 else:
                     eta_str = ""
                 
-                self.root.after(0, lambda f=filename, i=i, t=total_files, eta=eta_str: 
-                    self.progress_label.config(text=f"Processing file {i+1}/{t}: {f}{eta}"))
-                self.root.after(0, lambda f=filename: self.status_var.set(f"Processing {f}..."))
+                # One coalesced UI update per file, skipped when files finish in quick
+                # succession (e.g. cache hits) so the Tk event queue isn't flooded
+                now = time.monotonic()
+                if now - last_ui_update > 0.1:
+                    self.root.after(0, self._update_batch_ui, progress,
+                                    f"Processing file {i+1}/{total_files}: {filename}{eta_str}",
+                                    f"Processing {filename}...")
+                    last_ui_update = now
                 
                 try:
                     # Set transcription state for this batch file
                     self.process_manager._transcribing = True
-                    print(f"Debug: Starting batch transcription for file {current_file + 1}/{total_files}")
-                    time.sleep(0.5)  # Brief pause between files
-                    
-                    # Transcribe current file using MLX large-v3
-                    language = self.language_var.get() if self.language_var.get() != "auto" else None
-                    mlx_model_name = "mlx-community/whisper-large-v3-mlx"
+                    log.debug("Starting batch transcription for file %s/%s", i + 1, total_files)
                     
-                    # Set isolation environment for batch processing
-                    old_env = {}
                     try:
-                        for key in ['PYTHONUNBUFFERED', 'MLX_DISABLE_METAL_CAPTURE', 'OBJC_DISABLE_INITIALIZE_FORK_SAFETY']:
-                            old_env[key] = os.environ.get(key, None)
-                        
-                        os.environ['PYTHONUNBUFFERED'] = '1'
-                        os.environ['MLX_DISABLE_METAL_CAPTURE'] = '1'
-                        os.environ['OBJC_DISABLE_INITIALIZE_FORK_SAFETY'] = 'YES'
-                        
-                        result = mlx_whisper.transcribe(
-                            file_path,
-                            path_or_hf_repo=mlx_model_name,
-                            language=language
-                        )
+                        # Preloaded audio (or cached result), or the error preloading it
+                        if isinstance(loaded, Exception):
+                            raise loaded
+                        key, result, audio = loaded
+                        if result is None:
+                            if model_load:
+                                try:
+                                    model_load[0].result()
+                                except Exception as e:
+                                    log.debug("Model preload failed, transcribe() will load it: %s", e)
+                            result = mlx_whisper.transcribe(
+                                audio,
+                                path_or_hf_repo=mlx_model_name,
+                                language=language
+                            )
+                            if key:
+                                executor.submit(self.transcript_cache.store, key, result)
                     finally:
-                        # Restore environment and reset transcription state
+                        # Reset transcription state
                         self.process_manager._transcribing = False
-                        for key, value in old_env.items():
-                            if value is None:
-                                os.environ.pop(key, None)
-                            else:
-                                os.environ[key] = value
                     
                     transcript = result.get("text", "").strip()
-                    all_transcripts.append(f"=== {filename} ===\n{transcript}\n")
+                    self._append_batch_result(f"=== {filename} ===\n{transcript}\n\n")
                     
                     # Auto-save individual file if enabled
-                    if self.auto_save_var.get() and transcript:
-                        self.auto_save_transcript(transcript, file_path)
+                    if auto_save and transcript:
+                        executor.submit(self.auto_save_transcript, transcript, file_path)
                     
                 except Exception as e:
                     error_msg = f"Error processing {filename}: {str(e)}"
-                    all_transcripts.append(f"=== {filename} ===\nERROR: {error_msg}\n")
+                    self._append_batch_result(f"=== {filename} ===\nERROR: {error_msg}\n\n")
             
-            # Update UI with all results
-            combined_text = "\n".join(all_transcripts)
-            self.root.after(0, lambda: self.display_batch_results(combined_text, total_files))
+            self.root.after(0, self.display_batch_results, total_files)
             
         except Exception as e:
             error_msg = f"Batch processing error: {str(e)}"
-            self.root.after(0, lambda: self.show_error(error_msg))
+            self.root.after(0, self.show_error, error_msg)
         
         finally:
+            # Stop decoding files that won't be processed and finish pending saves
+            decode_stop.set()
+            decode_slots.release()  # Wake the decoder if it is waiting for a slot
+            if decoder:
+                decoder.join()
+            executor.shutdown(wait=True)
+            if self._batch_fh:
+                self._batch_fh.close()
+                self._batch_fh = None
             # Reset transcription state and cleanup
             self.process_manager._transcribing = False
             self.process_manager.kill_ffmpeg_processes(force=True)
             # Re-enable UI
             self.root.after(0, self.batch_processing_complete)
     
-    def display_batch_results(self, combined_text, file_count):
-        """Display batch processing results"""
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, combined_text)
-        
-        # Auto-save batch results if enabled
-        if self.auto_save_var.get() and combined_text.strip():
-            self.auto_save_batch_results(combined_text)
+    def _decode_batch_files(self, file_paths, mlx_model_name, language, out_q, slots, stop, on_miss):
+        """Preload batch files in order onto out_q (runs on the decode thread)
+        
+        Each entry is _preload_batch_file's result, or the exception it raised;
+        None is put last if decoding stops before every file is loaded.
+        on_miss is called before each file that has to be decoded.
+        """
+        for file_path in file_paths:
+            slots.acquire()
+            if stop.is_set() or not self.is_processing:
+                out_q.put(None)
+                return
+            try:
+                out_q.put(self._preload_batch_file(file_path, mlx_model_name, language, on_miss))
+            except Exception as e:
+                out_q.put(e)
+    
+    def _preload_batch_file(self, file_path, mlx_model_name, language, on_miss=None):
+        """Look up and decode a batch file ahead of transcription (runs on a worker thread)
         
+        Returns (cache_key, cached_result, audio); audio is only decoded on a cache miss,
+        after calling on_miss.
+        """
+        try:
+            key = self.transcript_cache.key(file_path, mlx_model_name, language)
+        except OSError:
+            key = None  # Let decoding report unreadable files
+        
+        if key:
+            cached = self.transcript_cache.lookup(key)
+            if cached is not None:
+                return key, cached, None
+        if on_miss:
+            on_miss()
+        return key, None, decode_audio(file_path)
+    
+    def _update_batch_ui(self, progress, label_text, status_text):
+        """Update batch progress bar, label and status together"""
+        self.progress_var.set(progress)
+        self.progress_label.config(text=label_text)
+        self.status_var.set(status_text)
+    
+    def _append_batch_result(self, chunk):
+        """Show one file's batch result and append it to the batch results file"""
+        self.root.after(0, self._queue_result_text, chunk)
+        if self._batch_fh:
+            try:
+                self._batch_fh.write(chunk)
+            except OSError as e:
+                print(f"Batch auto-save error: {e}")
+                self.root.after(0, self.status_var.set, "Error: Could not auto-save batch results")
+                self._batch_fh.close()
+                self._batch_fh = None
+    
+    def display_batch_results(self, file_count):
+        """Display batch processing summary"""
         self.status_var.set(f"Batch processing complete. {file_count} files processed.")
     
     def batch_processing_complete(self):
@@ -1425,9 +1911,8 @@ Transcript:
             audio_path = Path(audio_file_path)
             text_file_path = audio_path.with_suffix('.txt')
             
-            # Write transcript to text file
-            with open(text_file_path, 'w', encoding='utf-8') as f:
-                f.write(transcript)
+            # Write transcript to text file in a single write
+            text_file_path.write_bytes(transcript.encode('utf-8'))
             
             self.status_var.set(f"Transcript auto-saved to {text_file_path.name}")
             
@@ -1435,61 +1920,21 @@ Transcript:
             print(f"Auto-save error: {e}")
             self.status_var.set("Error: Could not auto-save transcript")
     
-    def auto_save_batch_results(self, combined_text):
-        """Auto-save batch processing results"""
+    def _open_batch_results_file(self):
+        """Open the file that batch results are auto-saved to as they finish"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             batch_file_path = Path(f"batch_transcripts_{timestamp}.txt")
-            
-            # Write combined results to text file
-            with open(batch_file_path, 'w', encoding='utf-8') as f:
-                f.write(combined_text)
-            
-            self.status_var.set(f"Batch results auto-saved to {batch_file_path.name}")
+            return open(batch_file_path, 'w', encoding='utf-8', buffering=1024 * 1024)
             
         except Exception as e:
             print(f"Batch auto-save error: {e}")
-            self.status_var.set("Error: Could not auto-save batch results")
+            self.root.after(0, self.status_var.set, "Error: Could not auto-save batch results")
+            return None
     
-    def _setup_process_monitoring(self):
-        """Set up periodic process monitoring to catch orphaned ffmpeg processes"""
-        def monitor_processes():
-            try:
-                import psutil
-                # Check for orphaned ffmpeg processes every 30 seconds
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'ppid']):
-                    try:
-                        proc_info = proc.info
-                        if 'ffmpeg' in proc_info.get('name', '').lower():
-                            cmdline = proc_info.get('cmdline', [])
-                            # Check if this ffmpeg is processing audio (likely from our app)
-                            if any('s16le' in str(arg) or '16000' in str(arg) for arg in cmdline):
-                                # Check if parent is still alive and is our app
-                                try:
-                                    parent = proc.parent()
-                                    if parent is None or not parent.is_running():
-                                        print(f"Debug: Terminating orphaned ffmpeg process {proc_info['pid']}")
-                                        proc.terminate()
-                                        proc.wait(timeout=2)
-                                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
-                                    pass
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-            except ImportError:
-                pass  # psutil not available
-            except Exception as e:
-                print(f"Debug: Process monitoring error: {e}")
-            
-            # Schedule next check
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                self.root.after(30000, monitor_processes)  # Check every 30 seconds
-        
-        # Start monitoring after a delay
-        self.root.after(5000, monitor_processes)  # Start after 5 seconds
-
     def on_closing(self):
         """Handle window closing event"""
-        print("Debug: Application closing, performing quick cleanup")
+        log.debug("Application closing, performing quick cleanup")
         
         # Immediately disable monitoring to prevent interference
         if hasattr(self.process_manager, 'monitoring_enabled'):
@@ -1511,8 +1956,9 @@ Transcript:
                 # Quick cleanup only
                 self.process_manager.cleanup_all()
                 self.instance_lock.release_lock()
+                self._http.close()
             except Exception as e:
-                print(f"Debug: Background cleanup error: {e}")
+                log.debug("Background cleanup error: %s", e)
             finally:
                 # Force exit regardless
                 import os
@@ -1543,7 +1989,7 @@ Transcript:
             self.root.focus_force()
             
             # Flash the dock icon on macOS
-            if platform.system() == "Darwin":
+            if _PLATFORM == "Darwin":
                 try:
                     # Try to use osascript to bounce the dock icon
                     subprocess.run(['osascript', '-e', 
@@ -1554,11 +2000,50 @@ Transcript:
         except Exception:
             pass
     
+    def _recheck_minutes(self, *args):
+        """Recompute whether CIRCUIT credentials are configured after one of them changes"""
+        if self._loading_settings:
+            return  # load_settings rechecks once after applying every value
+        self._circuit_ok = bool(self.client_id_var.get().strip() and 
+                                self.client_secret_var.get().strip() and 
+                                self.app_key_var.get().strip())
+        self._token = None  # Cached token belongs to the previous credentials
+        self.update_minutes_button_state()
+    
+    def _on_result_modified(self, event=None):
+        """Track whether the transcript box has any content"""
+        if not self.result_text.edit_modified():
+            return  # Triggered by resetting the modified flag below
+        self._has_transcript = self.result_text.index('end-1c') != '1.0'
+        self.result_text.edit_modified(False)
+        self.update_minutes_button_state()
+    
     def circuit_credentials_configured(self):
         """Check if CIRCUIT API credentials are configured"""
-        return (self.client_id_var.get().strip() and 
-                self.client_secret_var.get().strip() and 
-                self.app_key_var.get().strip())
+        return self._circuit_ok
+    
+    def can_generate_minutes(self):
+        """Check if a transcript exists and CIRCUIT credentials are configured"""
+        return self._has_transcript and self._circuit_ok
+    
+    def update_minutes_button_state(self):
+        """Schedule a refresh of the Generate Minutes button, coalescing repeated requests"""
+        if self._minutes_button_update_pending:
+            return
+        self._minutes_button_update_pending = True
+        self.root.after_idle(self._refresh_minutes_button)
+    
+    def _refresh_minutes_button(self):
+        """Enable or disable the Generate Minutes button if its state has changed"""
+        self._minutes_button_update_pending = False
+        if not hasattr(self, 'generate_minutes_btn'):
+            return  # Minutes tab not built yet
+        
+        can_generate = self.can_generate_minutes()
+        if can_generate == self._can_generate_cached:
+            return
+        self._can_generate_cached = can_generate
+        self.generate_minutes_btn.config(state="normal" if can_generate else "disabled")
     
     def test_circuit_connection(self):
         """Test CIRCUIT API connection"""
@@ -1568,7 +2053,7 @@ Transcript:
         
         def test_in_thread():
             try:
-                # Get access token
+                # Always contact the server, even if a token is cached
                 token = self.get_circuit_token()
                 if token:
                     status_msg = "✅ CIRCUIT API connection successful"
@@ -1584,9 +2069,6 @@ Transcript:
     
     def get_circuit_token(self):
         """Get OAuth2 access token from CIRCUIT API"""
-        import requests
-        import base64
-        
         client_id = self.client_id_var.get().strip()
         client_secret = self.client_secret_var.get().strip()
         
@@ -1602,21 +2084,32 @@ Transcript:
         data = "grant_type=client_credentials"
         
         try:
-            response = requests.post(url, headers=headers, data=data, timeout=30)
+            response = self._http.post(url, headers=headers, data=data, timeout=30)
             response.raise_for_status()
             token_data = response.json()
-            return token_data.get('access_token')
+            token = token_data.get('access_token')
+            if token:
+                # Refresh a minute before the token actually expires
+                expires_in = token_data.get('expires_in', 3600)
+                self._token = token
+                self._token_exp = time.time() + expires_in - 60
+            return token
         except Exception:
             return None
     
+    def _valid_token(self):
+        """Return the cached access token if it hasn't expired"""
+        return self._token if time.time() < self._token_exp else None
+    
     def generate_minutes(self):
         """Generate meeting minutes from transcript using CIRCUIT API"""
         if not hasattr(self, 'result_text'):
             messagebox.showerror("Error", "No transcript available for minutes generation")
             return
             
-        transcript = self.result_text.get(1.0, tk.END).strip()
-        if not transcript:
+        # 'end-1c' skips Tk's trailing newline, so no stripped copy is needed
+        transcript = self.result_text.get("1.0", "end-1c")
+        if not transcript or transcript.isspace():
             messagebox.showerror("Error", "Transcript is empty")
             return
         
@@ -1625,7 +2118,7 @@ Transcript:
             messagebox.showerror("Error", "CIRCUIT API credentials not configured. Please check Settings tab.")
             return
         
-        # Disable button and show progress
+        # Disable button and show progress; previous minutes stay until new text arrives
         self.generate_minutes_btn.config(state="disabled")
         self.minutes_progress.start()
         self.minutes_status.config(text="Generating meeting minutes with CIRCUIT API...")
@@ -1633,14 +2126,17 @@ Transcript:
         def generate_in_thread():
             try:
                 # Get access token
-                token = self.get_circuit_token()
+                token = self._valid_token() or self.get_circuit_token()
                 if not token:
                     error_msg = "Failed to authenticate with CIRCUIT API"
                     self.root.after(0, lambda: self.show_minutes_error(error_msg))
                     return
                 
                 # Get custom prompt template and selected language
-                custom_prompt = self.minutes_prompt_text.get(1.0, tk.END).strip()
+                if hasattr(self, 'minutes_prompt_text'):
+                    custom_prompt = self.minutes_prompt_text.get(1.0, tk.END).strip()
+                else:
+                    custom_prompt = self.minutes_template.strip()
                 selected_language = self.minutes_language_var.get()
                 
                 # Determine output language
@@ -1652,25 +2148,27 @@ Transcript:
                 
                 # Replace placeholders with actual values
                 if custom_prompt and "{transcript}" in custom_prompt:
-                    prompt = custom_prompt.replace("{transcript}", transcript).replace("{language}", language_instruction)
+                    # Substitute the language first so the long transcript is only copied once
+                    prompt = custom_prompt.replace("{language}", language_instruction).replace("{transcript}", transcript)
                 else:
-                    prompt = f"""Please create professional meeting minutes from the following transcript. Include:
-
-1. **Meeting Summary**: Brief overview of the main topics discussed
-2. **Key Decisions**: Important decisions made during the meeting
-3. **Action Items**: Tasks assigned with responsible parties (if mentioned)
-4. **Next Steps**: Planned follow-up actions or next meetings
-
-Format the output in clear, professional language suitable for business documentation.
-
-Transcript:
-{transcript}"""
+                    prompt = "".join([FALLBACK_MINUTES_PROMPT_PREFIX, transcript])
+                
+                # Call CIRCUIT API, showing the minutes as they are generated
+                started = False
+                def on_delta(delta):
+                    nonlocal started
+                    self.root.after(0, self._insert_minutes_delta, delta, not started)
+                    started = True
                 
-                # Call CIRCUIT API
-                minutes_text = self.call_circuit_api(token, prompt)
+                minutes_text = self.call_circuit_api(token, prompt, on_delta=on_delta)
+                if minutes_text is None and self._token != token:
+                    # The cached token was rejected (and dropped); retry once with a fresh one
+                    token = self.get_circuit_token()
+                    if token:
+                        minutes_text = self.call_circuit_api(token, prompt, on_delta=on_delta)
                 if minutes_text:
-                    # Display the generated minutes
-                    self.root.after(0, lambda: self.display_minutes(minutes_text))
+                    # Finish displaying the generated minutes
+                    self.root.after(0, self.display_minutes)
                 else:
                     error_msg = "Failed to generate minutes using CIRCUIT API"
                     self.root.after(0, lambda: self.show_minutes_error(error_msg))
@@ -1682,10 +2180,18 @@ Transcript:
         # Start generation in background thread
         threading.Thread(target=generate_in_thread, daemon=True).start()
     
-    def call_circuit_api(self, token, prompt):
-        """Call CIRCUIT API to generate meeting minutes"""
-        import requests
+    def _insert_minutes_delta(self, delta, replace):
+        """Append streamed minutes text, replacing the previous minutes on the first piece"""
+        if replace:
+            self.minutes_text.delete('1.0', 'end')
+        self.minutes_text.insert('end', delta)
+    
+    def call_circuit_api(self, token, prompt, on_delta=None):
+        """Call CIRCUIT API to generate meeting minutes
         
+        The response is streamed; each piece of generated text is passed to
+        on_delta as it arrives and the complete text is returned.
+        """
         model = self.circuit_model_var.get()
         app_key = self.app_key_var.get().strip()
         
@@ -1716,35 +2222,60 @@ Transcript:
                 }
             ],
             "user": f'{{"appkey": "{app_key}"}}',
-            "stop": ["<|im_end|>"]
+            "stop": ["<|im_end|>"],
+            "stream": True
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
-            response.raise_for_status()
-            
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                return result['choices'][0]['message']['content']
-            else:
-                print(f"Debug: Unexpected API response format: {result}")
-                return None
+            # The with block returns the connection to the session pool on every exit path
+            with self._http.post(url, headers=headers, json=payload, stream=True, timeout=120) as response:
+                if not response.ok:
+                    log.debug("HTTP error %s: %s", response.status_code, response.text)
+                    if response.status_code in (401, 403) and self._token == token:
+                        self._token = None  # Don't reuse a token the server rejected
+                    return None
+                
+                # Fall back to a regular JSON body if the deployment doesn't stream
+                if 'text/event-stream' not in response.headers.get('Content-Type', ''):
+                    result = response.json()
+                    if 'choices' in result and len(result['choices']) > 0:
+                        content = result['choices'][0]['message']['content']
+                        if on_delta and content:
+                            on_delta(content)
+                        return content
+                    else:
+                        log.debug("Unexpected API response format: %s", result)
+                        return None
+                
+                # Server-sent events: "data: {json}" lines terminated by "data: [DONE]".
+                # SSE is always UTF-8, whatever charset requests would guess
+                parts = []
+                for raw_line in response.iter_lines():
+                    line = raw_line.decode('utf-8')
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[5:].strip()
+                    if data == '[DONE]':
+                        break
+                    chunk = json.loads(data)
+                    choices = chunk.get('choices') or []
+                    delta = choices[0].get('delta', {}).get('content') if choices else None
+                    if delta:
+                        parts.append(delta)
+                        if on_delta:
+                            on_delta(delta)
+                return "".join(parts) or None
                 
-        except requests.exceptions.HTTPError as e:
-            print(f"Debug: HTTP error {response.status_code}: {response.text}")
-            return None
         except requests.exceptions.RequestException as e:
-            print(f"Debug: Request error: {str(e)}")
+            log.debug("Request error: %s", e)
             return None
         except Exception as e:
-            print(f"Debug: Unexpected error in CIRCUIT API call: {str(e)}")
+            log.debug("Unexpected error in CIRCUIT API call: %s", e)
             return None
     
     
-    def display_minutes(self, minutes_text):
-        """Display generated meeting minutes"""
-        self.minutes_text.delete(1.0, tk.END)
-        self.minutes_text.insert(tk.END, minutes_text)
+    def display_minutes(self):
+        """Finish displaying generated meeting minutes (the text is streamed in as it arrives)"""
         
         # Re-enable controls
         self.generate_minutes_btn.config(state="normal")
@@ -1765,8 +2296,8 @@ Transcript:
         if not hasattr(self, 'minutes_text'):
             return
             
-        minutes_content = self.minutes_text.get(1.0, tk.END).strip()
-        if not minutes_content:
+        minutes_content = self.minutes_text.get('1.0', 'end-1c')
+        if not minutes_content or minutes_content.isspace():
             messagebox.showwarning("Warning", "No meeting minutes to save")
             return
         
@@ -1778,8 +2309,10 @@ Transcript:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(minutes_content)
+                # Encode a slice at a time so large minutes never exist twice in memory
+                with open(filename, 'wb') as f:
+                    for start in range(0, len(minutes_content), MINUTES_WRITE_CHUNK):
+                        f.write(minutes_content[start:start + MINUTES_WRITE_CHUNK].encode('utf-8'))
                 messagebox.showinfo("Success", f"Meeting minutes saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file: {str(e)}")
@@ -1789,8 +2322,8 @@ Transcript:
         if not hasattr(self, 'minutes_text'):
             return
             
-        minutes_content = self.minutes_text.get(1.0, tk.END).strip()
-        if not minutes_content:
+        minutes_content = self.minutes_text.get('1.0', 'end-1c')
+        if not minutes_content or minutes_content.isspace():
             messagebox.showwarning("Warning", "No meeting minutes to copy")
             return
         
@@ -1806,35 +2339,73 @@ Transcript:
             "app_key": self.app_key_var.get().strip(),
             "circuit_model": self.circuit_model_var.get(),
             "minutes_language": self.minutes_language_var.get(),
-            "minutes_template": self.minutes_prompt_text.get(1.0, tk.END).strip()
+            "minutes_template": self.minutes_prompt_text.get('1.0', 'end-1c').strip()
         }
         
         try:
-            settings_file = os.path.expanduser("~/.mlx_whisper_circuit_settings.json")
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Serialize up front so the file gets a single write
+            if orjson is not None:
+                payload = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(settings, indent=2, ensure_ascii=False).encode('utf-8')
+            # Write a sibling temp file and swap it in, so an interrupted save
+            # never leaves a truncated settings file behind
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(_SETTINGS_FILE), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, _SETTINGS_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             messagebox.showinfo("Success", "Settings saved successfully")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
     
+    def _ensure_settings_loaded(self):
+        """Load saved settings the first time the Minutes or Settings tab is built"""
+        if not self._settings_loaded:
+            self._settings_loaded = True
+            self.load_settings()
+    
     def load_settings(self):
         """Load saved CIRCUIT API settings"""
         try:
-            settings_file = os.path.expanduser("~/.mlx_whisper_circuit_settings.json")
-            if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
+            if os.path.exists(_SETTINGS_FILE):
+                with open(_SETTINGS_FILE, 'rb') as f:
+                    data = f.read()
+                settings = orjson.loads(data) if orjson is not None else json.loads(data)
                 
-                # Load API credentials
-                self.client_id_var.set(settings.get("client_id", ""))
-                self.client_secret_var.set(settings.get("client_secret", ""))
-                self.app_key_var.set(settings.get("app_key", ""))
-                self.circuit_model_var.set(settings.get("circuit_model", "gpt-4o-mini"))
-                self.minutes_language_var.set(settings.get("minutes_language", "Auto (from transcript)"))
+                # Unknown or legacy model names fall back to the default model
+                saved_model = str(settings.get("circuit_model", "")).partition(" (")[0]
+                saved_model = _CIRCUIT_MODEL_LOOKUP.get(saved_model.strip().casefold(), "gpt-4o-mini")
+                
+                # Load API credentials, skipping unchanged values; the credential
+                # traces are held off and run once after all values are applied
+                changed = False
+                self._loading_settings = True
+                try:
+                    for var, value in (
+                        (self.client_id_var, settings.get("client_id", "")),
+                        (self.client_secret_var, settings.get("client_secret", "")),
+                        (self.app_key_var, settings.get("app_key", "")),
+                        (self.circuit_model_var, saved_model),
+                        (self.minutes_language_var, settings.get("minutes_language", "Auto (from transcript)")),
+                    ):
+                        if var.get() != value:
+                            var.set(value)
+                            changed = True
+                finally:
+                    self._loading_settings = False
+                if changed:
+                    self._recheck_minutes()
                 
                 # Load minutes template
                 minutes_template = settings.get("minutes_template", "")
-                if minutes_template and hasattr(self, 'minutes_prompt_text'):
+                if minutes_template:
+                    self.minutes_template = minutes_template
+                if (minutes_template and hasattr(self, 'minutes_prompt_text')
+                        and self.minutes_prompt_text.get('1.0', 'end-1c') != minutes_template):
                     self.minutes_prompt_text.delete(1.0, tk.END)
                     self.minutes_prompt_text.insert(tk.END, minutes_template)
                     
@@ -1871,72 +2442,107 @@ Transcript:
                     pass
                 return False
         
-        try:
-            # Bring window to front on startup
-            self.root.after(100, self.bring_to_front)
-            self.root.mainloop()
-        finally:
-            self.instance_lock.release_lock()
+        # The lock is released by the atexit and signal handlers that
+        # acquire_lock registered
+        self.root.after(100, self.bring_to_front)  # Bring window to front on startup
+        self.root.mainloop()
         
         return True
     
     def _try_focus_existing_instance(self):
-        """Try to focus the existing instance"""
+        """Try to focus the existing instance
+        
+        Uses AppKit directly when PyObjC is available and the bundled app is
+        running. Otherwise the AppleScript that worked last time is tried
+        first, so repeated double-launches usually need a single osascript call.
+        """
         try:
-            if platform.system() == "Darwin":
-                # First try with the bundle identifier
+            system = _PLATFORM
+            if system == "Darwin":
                 try:
-                    subprocess.run([
-                        'osascript', '-e',
-                        'tell application "MLXWhisperGUI" to activate'
-                    ], capture_output=True, timeout=2)
-                except:
-                    # Fallback: try with process name
+                    from AppKit import NSRunningApplication, NSApplicationActivateIgnoringOtherApps
+                    # This second launch has the same bundle identifier; skip it
+                    apps = [app for app in
+                            NSRunningApplication.runningApplicationsWithBundleIdentifier_(APP_BUNDLE_ID)
+                            if app.processIdentifier() != os.getpid()]
+                    if apps:
+                        apps[0].activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+                        return
+                except ImportError:
+                    pass
+                
+                strategy_file = os.path.join(_LOCK_DIR, "focus_strategy")
+                preferred = _FOCUS_STRATEGY_CACHE.get(system)
+                if preferred is None:
                     try:
-                        subprocess.run([
-                            'osascript', '-e',
-                            'tell application "System Events" to tell process "MLXWhisperGUI" to set frontmost to true'
-                        ], capture_output=True, timeout=2)
-                    except:
-                        # Final fallback: try to find and activate any MLX Whisper window
-                        subprocess.run([
-                            'osascript', '-e',
-                            '''tell application "System Events"
-                                set procs to every process whose name contains "MLX" or name contains "Whisper"
-                                if length of procs > 0 then
-                                    set frontmost of item 1 of procs to true
-                                end if
-                            end tell'''
-                        ], capture_output=True, timeout=2)
+                        with open(strategy_file, 'r') as f:
+                            preferred = int(f.readline())
+                    except (OSError, ValueError):
+                        preferred = 0
+                
+                order = list(range(len(FOCUS_SCRIPTS)))
+                if 0 <= preferred < len(order):
+                    order.remove(preferred)
+                    order.insert(0, preferred)
+                
+                for index in order:
+                    try:
+                        result = subprocess.run(['osascript', '-e', FOCUS_SCRIPTS[index]],
+                                                capture_output=True, timeout=2)
+                    except (OSError, subprocess.SubprocessError):
+                        continue
+                    if result.returncode == 0:
+                        _FOCUS_STRATEGY_CACHE[system] = index
+                        if index != preferred:
+                            try:
+                                with open(strategy_file, 'w') as f:
+                                    f.write(str(index))
+                            except OSError:
+                                pass
+                        break
         except Exception:
             pass
 
 
-def main():
-    """Main entry point with crash recovery"""
-    # Setup FFmpeg path for bundled app
-    setup_ffmpeg_path()
+def _cleanup_stale_locks():
+    """Remove PID files left behind by crashed instances (runs on a background thread)
     
-    # Clean up any stale lock files from previous crashes
+    Lock files are left alone: flock locks die with their process, so a stale
+    lock file is simply reused, while unlinking one that is held or being
+    acquired would let two instances lock different files.
+    """
     try:
-        temp_lock = SingleInstanceLock()
-        # Check if there are stale locks without acquiring them
-        if platform.system() == "Darwin":
-            lock_dir = os.path.expanduser("~/Library/Application Support/MLXWhisperGUI")
+        if _PLATFORM == "Darwin":
+            lock_dir = _LOCK_DIR
             if os.path.exists(lock_dir):
-                for file in os.listdir(lock_dir):
-                    if file.endswith('.lock') or file.endswith('.pid'):
-                        file_path = os.path.join(lock_dir, file)
+                # Files older than 1 hour are likely stale
+                cutoff = time.time() - 3600
+                with os.scandir(lock_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith('.pid'):
+                            continue
                         try:
-                            # Check if file is older than 1 hour (likely stale)
-                            if os.path.getmtime(file_path) < time.time() - 3600:
-                                os.remove(file_path)
+                            if entry.stat().st_mtime < cutoff:
+                                os.remove(entry.path)
                         except:
                             pass
     except Exception:
         pass
+
+
+def main():
+    """Main entry point with crash recovery"""
+    # Debug output is only emitted when MLXWHISPER_DEBUG=1
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    
+    # Setup FFmpeg path for bundled app
+    setup_ffmpeg_path()
+    
+    # Clean up stale lock files from previous crashes while the GUI is built
+    threading.Thread(target=_cleanup_stale_locks, name="lock-cleanup", daemon=True).start()
     
     # Create and run the application
+    app = None
     try:
         app = WhisperGUI()
         success = app.run()
@@ -1951,8 +2557,15 @@ def main():
         error_msg = f"An unexpected error occurred:\n\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
         
         try:
-            # Try to show error dialog
-            root = tk.Tk()
+            # Try to show error dialog, reusing the app's Tk root if it is still alive
+            root = getattr(app, 'root', None) or tk._default_root
+            try:
+                if root is not None and not root.winfo_exists():
+                    root = None
+            except tk.TclError:
+                root = None
+            if root is None:
+                root = tk.Tk()
             root.withdraw()  # Hide main window
             messagebox.showerror("MLX Whisper GUI - Fatal Error", error_msg)
             root.destroy()